@@ -15,6 +15,12 @@ from twisted.python.filepath import FilePath
 from twisted.trial._synctest import _collectWarnings, _setWarningRegistryToNone
 from twisted.trial.unittest import SynchronousTestCase
 
+_helperModuleSource = b"""
+import warnings
+def foo():
+    warnings.warn("oh no")
+"""
+
 
 class Mask:
     """
@@ -50,23 +56,39 @@ class FlushWarningsTests(SynchronousTestCase):
     emitted so far in a test.
     """
 
-    def assertDictSubset(self, set, subset):
+    def _makeHelperPackage(self, moduleName: bytes) -> FilePath:
         """
-        Assert that all the keys present in C{subset} are also present in
-        C{set} and that the corresponding values are equal.
+        Create a C{twisted_private_helper} package containing a single module
+        with a C{foo} function which emits a warning, and make it importable
+        for the duration of the test.
+
+        @param moduleName: The file name of the module to create in the
+            package.
+
+        @return: The package directory.
         """
-        for k, v in subset.items():
-            self.assertEqual(set[k], v)
+        package = FilePath(self.mktemp().encode("utf-8")).child(
+            b"twisted_private_helper"
+        )
+        package.makedirs()
+        package.child(b"__init__.py").setContent(b"")
+        package.child(moduleName).setContent(_helperModuleSource)
+        pathEntry = package.parent().path.decode("utf-8")
+        sys.path.insert(0, pathEntry)
+        self.addCleanup(sys.path.remove, pathEntry)
+        return package
 
     def assertDictSubsets(self, sets, subsets):
         """
         For each pair of corresponding elements in C{sets} and C{subsets},
-        assert that the element from C{subsets} is a subset of the element from
-        C{sets}.
+        assert that all the keys present in the element from C{subsets} are
+        also present in the element from C{sets} and that the corresponding
+        values are equal.
         """
         self.assertEqual(len(sets), len(subsets))
-        for a, b in zip(sets, subsets):
-            self.assertDictSubset(a, b)
+        actual = [tuple(s[k] for k in sub) for s, sub in zip(sets, subsets)]
+        expected = [tuple(sub.values()) for sub in subsets]
+        self.assertEqual(actual, expected)
 
     def test_none(self):
         """
@@ -106,9 +128,11 @@ class FlushWarningsTests(SynchronousTestCase):
         for i in range(2):
             warnings.warn(message=message, category=category)
 
-        self.assertDictSubsets(
-            self.flushWarnings(), [{"category": category, "message": message}] * 2
-        )
+        flushed = self.flushWarnings()
+        self.assertEqual(len(flushed), 2)
+        for entry in flushed:
+            self.assertEqual(entry["category"], category)
+            self.assertEqual(entry["message"], message)
 
     def test_cleared(self):
         """
@@ -173,8 +197,7 @@ class FlushWarningsTests(SynchronousTestCase):
         case = Mask.MockTests("test_unflushed")
         case.category = CustomWarning
 
-        originalWarnings = warnings.filters[:]
-        try:
+        with warnings.catch_warnings():
             warnings.simplefilter("error")
             case.run(result)
             self.assertEqual(len(result.errors), 1)
@@ -186,8 +209,6 @@ class FlushWarningsTests(SynchronousTestCase):
                 .splitlines()[-1]
                 .endswith("CustomWarning: some warning text")
             )
-        finally:
-            warnings.filters[:] = originalWarnings
 
     def test_flushedWarningsConfiguredAsErrors(self):
         """
@@ -203,13 +224,10 @@ class FlushWarningsTests(SynchronousTestCase):
         case = Mask.MockTests("test_flushed")
         case.category = CustomWarning
 
-        originalWarnings = warnings.filters[:]
-        try:
+        with warnings.catch_warnings():
             warnings.simplefilter("error")
             case.run(result)
             self.assertEqual(result.errors, [])
-        finally:
-            warnings.filters[:] = originalWarnings
 
     def test_multipleFlushes(self):
         """
@@ -280,21 +298,7 @@ class FlushWarningsTests(SynchronousTestCase):
         Warnings emitted by a function the source code of which is not
         available can still be flushed.
         """
-        package = FilePath(self.mktemp().encode("utf-8")).child(
-            b"twisted_private_helper"
-        )
-        package.makedirs()
-        package.child(b"__init__.py").setContent(b"")
-        package.child(b"missingsourcefile.py").setContent(
-            b"""
-import warnings
-def foo():
-    warnings.warn("oh no")
-"""
-        )
-        pathEntry = package.parent().path.decode("utf-8")
-        sys.path.insert(0, pathEntry)
-        self.addCleanup(sys.path.remove, pathEntry)
+        package = self._makeHelperPackage(b"missingsourcefile.py")
         from twisted_private_helper import missingsourcefile  # type: ignore[import]
 
         self.addCleanup(sys.modules.pop, "twisted_private_helper")
@@ -315,21 +319,7 @@ def foo():
         various places.  If source files are renamed, .pyc files may not be
         regenerated, but they will contain incorrect filenames.
         """
-        package = FilePath(self.mktemp().encode("utf-8")).child(
-            b"twisted_private_helper"
-        )
-        package.makedirs()
-        package.child(b"__init__.py").setContent(b"")
-        package.child(b"module.py").setContent(
-            b"""
-import warnings
-def foo():
-    warnings.warn("oh no")
-"""
-        )
-        pathEntry = package.parent().path.decode("utf-8")
-        sys.path.insert(0, pathEntry)
-        self.addCleanup(sys.path.remove, pathEntry)
+        package = self._makeHelperPackage(b"module.py")
 
         # Import it to cause pycs to be generated
         from twisted_private_helper import module
@@ -427,10 +417,10 @@ class CollectWarningsTests(SynchronousTestCase):
         Any warnings emitted by a call to a function passed to
         L{_collectWarnings} are not actually emitted to the warning system.
         """
-        output = StringIO()
-        self.patch(sys, "stdout", output)
-        _collectWarnings(lambda x: None, warnings.warn, "text")
-        self.assertEqual(output.getvalue(), "")
+        with warnings.catch_warnings(record=True) as emitted:
+            warnings.simplefilter("always")
+            _collectWarnings(lambda x: None, warnings.warn, "text")
+        self.assertEqual(emitted, [])
 
     def test_callsFunction(self):
         """